@@ -134,18 +134,17 @@ print("\n" + "=" * 70)
 print("STEP 4: CREATE REGRESSION & CLASSIFICATION DATASETS")
 print("=" * 70)
 
-# --- REGRESSION DATASET ---
+# --- REGRESSION TARGET ---
 # Target: MedHouseVal (continuous)
 # Features: all engineered features
-reg_features = [c for c in df.columns if c != 'MedHouseVal']
-reg_df = df[reg_features + ['MedHouseVal']].copy()
+features = [c for c in df.columns if c != 'MedHouseVal']
 
 print(f"\nRegression dataset:")
-print(f"  Shape: {reg_df.shape[0]:,} × {len(reg_features)} features + target")
-print(f"  Target: MedHouseVal (${reg_df['MedHouseVal'].min()*100:.0f}K – ${reg_df['MedHouseVal'].max()*100:.0f}K)")
-print(f"  Features: {reg_features}")
+print(f"  Shape: {len(df):,} × {len(features)} features + target")
+print(f"  Target: MedHouseVal (${df['MedHouseVal'].min()*100:.0f}K – ${df['MedHouseVal'].max()*100:.0f}K)")
+print(f"  Features: {features}")
 
-# --- CLASSIFICATION DATASET ---
+# --- CLASSIFICATION TARGET ---
 # Target: is_high_value (binary: above median price)
 # Features: same as regression BUT exclude MedHouseVal (the target source)
 # Also exclude MedInc for a harder/more interesting classification task?
@@ -154,15 +153,13 @@ print(f"  Features: {reg_features}")
 median_val = df['MedHouseVal'].median()
 df['is_high_value'] = (df['MedHouseVal'] > median_val).astype(int)
 
-# For classification, we must NOT include MedHouseVal (it IS the target)
-clf_features = [c for c in df.columns if c not in ['MedHouseVal', 'is_high_value']]
-clf_df = df[clf_features + ['is_high_value']].copy()
-
+# For classification, we must NOT include MedHouseVal (it IS the target),
+# which leaves exactly the regression feature set
 print(f"\nClassification dataset:")
-print(f"  Shape: {clf_df.shape[0]:,} × {len(clf_features)} features + target")
+print(f"  Shape: {len(df):,} × {len(features)} features + target")
 print(f"  Target: is_high_value (median split at ${median_val*100:.0f}K)")
-print(f"  Class balance: {clf_df['is_high_value'].mean()*100:.1f}% high value")
-print(f"  Features: {clf_features}")
+print(f"  Class balance: {df['is_high_value'].mean()*100:.1f}% high value")
+print(f"  Features: same {len(features)} as regression")
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 5. SAVE
@@ -171,16 +168,20 @@ print("\n" + "=" * 70)
 print("STEP 5: SAVE DATASETS")
 print("=" * 70)
 
-reg_path = os.path.join(PROC_DIR, 'regression_dataset.csv')
-clf_path = os.path.join(PROC_DIR, 'classification_dataset.csv')
+# Both tasks share one feature matrix, so it is written once and each
+# target gets its own single-column file
+features_path = os.path.join(PROC_DIR, 'features.parquet')
+reg_target_path = os.path.join(PROC_DIR, 'target_regression.parquet')
+clf_target_path = os.path.join(PROC_DIR, 'target_classification.parquet')
 
-reg_df.to_csv(reg_path, index=False)
-clf_df.to_csv(clf_path, index=False)
+df[features].to_parquet(features_path, index=False, compression='snappy')
+df[['MedHouseVal']].to_parquet(reg_target_path, index=False, compression='snappy')
+df[['is_high_value']].to_parquet(clf_target_path, index=False, compression='snappy')
 
-print(f"Saved: {reg_path}")
-print(f"  {reg_df.shape[0]:,} rows × {reg_df.shape[1]} columns")
-print(f"Saved: {clf_path}")
-print(f"  {clf_df.shape[0]:,} rows × {clf_df.shape[1]} columns")
+print(f"Saved: {features_path}")
+print(f"  {len(df):,} rows × {len(features)} columns")
+print(f"Saved: {reg_target_path}")
+print(f"Saved: {clf_target_path}")
 
 print(f"""
 {'='*70}
@@ -191,8 +192,8 @@ Summary:
   Raw records:      20,640
   After cleaning:   {len(df):,}
   Engineered feats: {n_engineered}
-  Regression:       {reg_df.shape[1]-1} features → MedHouseVal
-  Classification:   {clf_df.shape[1]-1} features → is_high_value
+  Regression:       {len(features)} features → MedHouseVal
+  Classification:   {len(features)} features → is_high_value
 
 Next step: python enrich_data.py
 """)
@@ -2,7 +2,8 @@
 Step 2: Enrich Datasets with Web-Scraped External Data
 Add geographic features computed from live external API data sources.
 
-External data sources (fetched via HTTP at runtime):
+External data sources (fetched via HTTP; responses are cached in data/cache and
+reused on re-runs unless --refresh is passed):
   1. US Census Bureau Geocoding API - City coordinates
   2. NOAA NCEI Climate Data API - Weather station locations for coastline proxy
   3. Open-Meteo API - Climate zone validation data
@@ -22,15 +23,59 @@ Enrichment features (14 total):
 """
 
 import numpy as np
-import pandas as pd
 import os
-import requests
+import sys
+import json
 import time
+import hashlib
+import tempfile
+import requests
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+
+from processed_data import read_processed
+
+# orjson decodes API payloads several times faster when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 np.random.seed(42)
 
 PROJ_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PROC_DIR = os.path.join(PROJ_DIR, 'data', 'processed')
+CACHE_DIR = os.path.join(PROJ_DIR, 'data', 'cache')
+
+# API responses are cached on disk so re-runs skip the network entirely;
+# pass --refresh to ignore the cache and fetch everything again
+CACHE_MAX_AGE = 7 * 24 * 3600
+# Open-Meteo "current" readings go stale quickly, so they are only reused briefly
+CURRENT_WEATHER_MAX_AGE = 3600
+REFRESH_CACHE = '--refresh' in sys.argv
+
+# One keep-alive session shared by every API call; the semaphore caps how many
+# requests are in flight at once (replaces the old fixed sleeps between calls)
+MAX_IN_FLIGHT = 8
+API_SLOTS = threading.Semaphore(MAX_IN_FLIGHT)
+SESSION = requests.Session()
+# Per-host pool matches the in-flight cap, so every concurrent call can keep its
+# connection alive; transient rate-limit/server errors are retried with backoff
+# instead of falling back
+SESSION.mount('https://', HTTPAdapter(
+    pool_maxsize=MAX_IN_FLIGHT,
+    max_retries=Retry(total=5, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504])))
+MAX_WORKERS = 8
+NWS_HEADERS = {'User-Agent': 'DataScienceProject/1.0'}
+
+CITY_FALLBACKS = {
+    'SF': (37.7749, -122.4194), 'LA': (34.0522, -118.2437),
+    'San_Diego': (32.7157, -117.1611), 'Sacramento': (38.5816, -121.4944),
+    'San_Jose': (37.3382, -121.8863)
+}
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 1. LOAD BASE DATASETS
@@ -39,14 +84,14 @@ print("=" * 70)
 print("STEP 1: LOAD BASE DATASETS")
 print("=" * 70)
 
-reg_path = os.path.join(PROC_DIR, 'regression_dataset.csv')
-clf_path = os.path.join(PROC_DIR, 'classification_dataset.csv')
+# Regression and classification share one feature matrix; only the targets differ
 
-reg_df = pd.read_csv(reg_path)
-clf_df = pd.read_csv(clf_path)
+features_df = read_processed('features')
+y_reg = read_processed('target_regression')['MedHouseVal']
+y_clf = read_processed('target_classification')['is_high_value']
 
-print(f"Regression:     {reg_df.shape[0]:,} × {reg_df.shape[1]} columns")
-print(f"Classification: {clf_df.shape[0]:,} × {clf_df.shape[1]} columns")
+print(f"Features: {features_df.shape[0]:,} × {features_df.shape[1]} columns")
+print("Targets:  MedHouseVal (regression), is_high_value (classification)")
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 2. WEB SCRAPING: FETCH EXTERNAL DATA VIA API
@@ -55,10 +100,42 @@ print("\n" + "=" * 70)
 print("STEP 2: WEB SCRAPING - FETCH EXTERNAL DATA FROM APIs")
 print("=" * 70)
 
+def get_json(url, params=None, headers=None, max_age=CACHE_MAX_AGE):
+    """GET a JSON document through the shared session, holding one API slot.
+
+    Successful responses are cached in CACHE_DIR for max_age seconds,
+    keyed on the URL and query parameters.
+    """
+    key = hashlib.sha1(json.dumps([url, params], sort_keys=True).encode()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{key}.json")
+    if (not REFRESH_CACHE and os.path.exists(cache_path)
+            and time.time() - os.path.getmtime(cache_path) < max_age):
+        try:
+            with open(cache_path, 'rb') as f:
+                return json_loads(f.read())
+        except ValueError:
+            pass  # unreadable entry: treat as a miss and refetch below
+
+    with API_SLOTS:
+        response = SESSION.get(url, params=params, headers=headers, timeout=10)
+    response.raise_for_status()
+    data = json_loads(response.content)
+
+    # Write to a temp file and rename so an interrupted run never leaves a
+    # truncated entry behind
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, cache_path)
+    return data
+
+
 def fetch_census_city_coordinates():
     """
     Fetch city coordinates using US Census Bureau Geocoding API.
     API: https://geocoding.geo.census.gov/geocoder/locations/onelineaddress
+    Returns (city_coords, log_lines); lines are printed by the caller.
     """
     cities = {
         'SF': '1600 Pennsylvania Avenue, San Francisco, CA',
@@ -67,56 +144,44 @@ def fetch_census_city_coordinates():
         'Sacramento': '1600 Pennsylvania Avenue, Sacramento, CA',
         'San_Jose': '1600 Pennsylvania Avenue, San Jose, CA'
     }
-    
-    city_coords = {}
     base_url = "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress"
-    
-    print("\nFetching city coordinates from US Census Bureau API...")
-    for city_key, city_name in cities.items():
+
+    def geocode(city):
+        city_key, city_name = city
         try:
             params = {
                 'address': city_name,
                 'benchmark': 'Public_AR_Current',
                 'format': 'json'
             }
-            response = requests.get(base_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
+            data = get_json(base_url, params=params)
+
             if data.get('result', {}).get('addressMatches'):
                 match = data['result']['addressMatches'][0]
                 lat = match['coordinates']['y']
                 lon = match['coordinates']['x']
-                city_coords[city_key] = (lat, lon)
-                print(f"  ✓ {city_key}: ({lat:.4f}, {lon:.4f})")
-            else:
-                print(f"  ✗ No match for {city_key}, using fallback")
-                fallbacks = {
-                    'SF': (37.7749, -122.4194), 'LA': (34.0522, -118.2437),
-                    'San_Diego': (32.7157, -117.1611), 'Sacramento': (38.5816, -121.4944),
-                    'San_Jose': (37.3382, -121.8863)
-                }
-                city_coords[city_key] = fallbacks[city_key]
-            
-            time.sleep(0.5)
+                return city_key, (lat, lon), f"  ✓ {city_key}: ({lat:.4f}, {lon:.4f})"
+            return city_key, CITY_FALLBACKS[city_key], f"  ✗ No match for {city_key}, using fallback"
         except Exception as e:
-            print(f"  ✗ API error for {city_key}: {e}")
-            fallbacks = {
-                'SF': (37.7749, -122.4194), 'LA': (34.0522, -118.2437),
-                'San_Diego': (32.7157, -117.1611), 'Sacramento': (38.5816, -121.4944),
-                'San_Jose': (37.3382, -121.8863)
-            }
-            city_coords[city_key] = fallbacks[city_key]
-    
-    return city_coords
+            return city_key, CITY_FALLBACKS[city_key], f"  ✗ API error for {city_key}: {e}"
+
+    log = ["\nFetching city coordinates from US Census Bureau API..."]
+    city_coords = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for city_key, coords, message in pool.map(geocode, cities.items()):
+            log.append(message)
+            city_coords[city_key] = coords
+
+    return city_coords, log
 
 
 def fetch_noaa_coastline_stations():
     """
     Fetch NOAA weather stations for California coast via NWS API.
     Using NWS gridpoints API which is more reliable.
+    Returns (coast_points, log_lines); lines are printed by the caller.
     """
-    print("\nFetching NOAA coastal station data via NWS API...")
+    log = ["\nFetching NOAA coastal station data via NWS API..."]
     
     # Use NWS API to get stations for coastal California zones
     # Coastal zones: Monterey (Monterey Bay), San Francisco, Los Angeles
@@ -127,45 +192,45 @@ def fetch_noaa_coastline_stations():
         ("San Diego", 32.7, -117.2),
         ("Eureka", 40.8, -124.2),
     ]
-    
-    stations = []
     base_url = "https://api.weather.gov/points"
-    
-    for city_name, lat, lon in coastal_zones:
+
+    def zone_stations(zone):
+        city_name, lat, lon = zone
+        points = []
         try:
-            url = f"{base_url}/{lat},{lon}"
-            response = requests.get(url, timeout=10, headers={'User-Agent': 'DataScienceProject/1.0'})
-            
-            if response.status_code == 200:
-                data = response.json()
-                props = data.get('properties', {})
-                
-                # Get nearby observation stations
-                stations_url = props.get('observationStations')
-                if stations_url:
-                    stations_resp = requests.get(stations_url, timeout=10, headers={'User-Agent': 'DataScienceProject/1.0'})
-                    if stations_resp.status_code == 200:
-                        stations_data = stations_resp.json()
-                        for station in stations_data.get('features', [])[:6]:
-                            geom = station.get('geometry', {})
-                            if geom.get('type') == 'Point':
-                                coords = geom.get('coordinates', [0, 0])
-                                # coords are [lon, lat]
-                                stations.append((coords[1], coords[0]))
-                        print(f"  ✓ {city_name}: fetched stations")
-            else:
-                print(f"  ✗ NWS API error for {city_name}: {response.status_code}")
+            data = get_json(f"{base_url}/{lat},{lon}", headers=NWS_HEADERS)
+            props = data.get('properties', {})
+
+            # Get nearby observation stations
+            stations_url = props.get('observationStations')
+            if not stations_url:
+                return points, None
+            # Only the first 6 stations are used, so ask the API for just those
+            # rather than downloading the full station collection
+            stations_data = get_json(stations_url, params={'limit': 6}, headers=NWS_HEADERS)
+            for station in stations_data.get('features', [])[:6]:
+                geom = station.get('geometry', {})
+                if geom.get('type') == 'Point':
+                    coords = geom.get('coordinates', [0, 0])
+                    # coords are [lon, lat]
+                    points.append((coords[1], coords[0]))
+            return points, f"  ✓ {city_name}: fetched stations"
         except Exception as e:
-            print(f"  ✗ Error for {city_name}: {str(e)[:50]}")
-        
-        time.sleep(0.3)
+            return points, f"  ✗ Error for {city_name}: {str(e)[:50]}"
+
+    stations = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for points, message in pool.map(zone_stations, coastal_zones):
+            if message:
+                log.append(message)
+            stations.extend(points)
     
     if len(stations) >= 10:
-        print(f"  ✓ Total NOAA stations fetched: {len(stations)}")
-        return stations[:29]
+        log.append(f"  ✓ Total NOAA stations fetched: {len(stations)}")
+        return stations[:29], log
     
     # Fallback coastline
-    print(f"  → Using fallback coastline coordinates ({len(stations)} stations only)")
+    log.append(f"  → Using fallback coastline coordinates ({len(stations)} stations only)")
     return [(32.54, -117.12), (32.72, -117.17), (33.01, -117.29), (33.19, -117.38),
         (33.46, -117.60), (33.62, -117.93), (33.74, -118.29), (33.86, -118.40),
         (33.95, -118.47), (34.03, -118.77), (34.40, -119.69), (34.95, -120.44),
@@ -173,12 +238,15 @@ def fetch_noaa_coastline_stations():
         (36.96, -122.02), (37.50, -122.43), (37.62, -122.49), (37.79, -122.51),
         (37.83, -122.48), (38.06, -122.70), (38.30, -123.07), (38.79, -123.59),
         (39.43, -123.81), (40.44, -124.10), (40.80, -124.16), (41.06, -124.14),
-        (41.76, -124.20)]
+        (41.76, -124.20)], log
 
 
 def fetch_openmeteo_climate_zones():
-    """Fetch current weather data from Open-Meteo API for climate zone validation."""
-    print("\nFetching climate zone data from Open-Meteo API...")
+    """
+    Fetch current weather data from Open-Meteo API for climate zone validation.
+    Returns (climate_records, log_lines); lines are printed by the caller.
+    """
+    log = ["\nFetching climate zone data from Open-Meteo API..."]
     
     zone_cities = [
         ("San Diego", 32.7157, -117.1611, 1),
@@ -187,11 +255,11 @@ def fetch_openmeteo_climate_zones():
         ("Eureka", 40.8021, -124.1637, 4)
     ]
     
-    climate_data = []
     # Use the forecast API which is more reliable
     base_url = "https://api.open-meteo.com/v1/forecast"
-    
-    for city_name, lat, lon, zone_id in zone_cities:
+
+    def zone_climate(zone):
+        city_name, lat, lon, zone_id = zone
         try:
             params = {
                 'latitude': lat,
@@ -199,28 +267,29 @@ def fetch_openmeteo_climate_zones():
                 'current': 'temperature_2m,relative_humidity_2m',
                 'timezone': 'America/Los_Angeles'
             }
-            response = requests.get(base_url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                current = data.get('current', {})
-                temp = current.get('temperature_2m')
-                humidity = current.get('relative_humidity_2m')
-                
-                climate_data.append({
-                    'zone': zone_id,
-                    'city': city_name,
-                    'temp': temp,
-                    'humidity': humidity
-                })
-                print(f"  ✓ {city_name} (Zone {zone_id}): {temp}°C, {humidity}% RH")
-            else:
-                print(f"  ✗ API error for {city_name}: {response.status_code}")
+            current = get_json(base_url, params=params,
+                               max_age=CURRENT_WEATHER_MAX_AGE).get('current', {})
+            temp = current.get('temperature_2m')
+            humidity = current.get('relative_humidity_2m')
+
+            record = {
+                'zone': zone_id,
+                'city': city_name,
+                'temp': temp,
+                'humidity': humidity
+            }
+            return record, f"  ✓ {city_name} (Zone {zone_id}): {temp}°C, {humidity}% RH"
         except Exception as e:
-            print(f"  ✗ Error fetching {city_name}: {str(e)[:40]}")
-        time.sleep(0.3)
+            return None, f"  ✗ Error fetching {city_name}: {str(e)[:40]}"
+
+    climate_data = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for record, message in pool.map(zone_climate, zone_cities):
+            log.append(message)
+            if record is not None:
+                climate_data.append(record)
     
-    return climate_data
+    return climate_data, log
 
 
 # Fetch all external data
@@ -228,9 +297,19 @@ print("\n" + "-" * 70)
 print("WEB SCRAPING IN PROGRESS")
 print("-" * 70)
 
-CITIES = fetch_census_city_coordinates()
-COAST_POINTS = fetch_noaa_coastline_stations()
-CLIMATE_DATA = fetch_openmeteo_climate_zones()
+# The three sources are independent, so all of them are fetched at once;
+# API_SLOTS still caps the total number of requests in flight. Each fetcher
+# returns its log lines, printed afterwards in a fixed order
+with ThreadPoolExecutor(max_workers=3) as pool:
+    census_job = pool.submit(fetch_census_city_coordinates)
+    noaa_job = pool.submit(fetch_noaa_coastline_stations)
+    climate_job = pool.submit(fetch_openmeteo_climate_zones)
+    CITIES, census_log = census_job.result()
+    COAST_POINTS, noaa_log = noaa_job.result()
+    CLIMATE_DATA, climate_log = climate_job.result()
+
+for line in census_log + noaa_log + climate_log:
+    print(line)
 
 CLIMATE_ZONES = {
     1: "Southern CA (lat < 34°) — warm/arid", 2: "Central CA (34°-36°) — Mediterranean",
@@ -322,12 +401,9 @@ def compute_enrichment(df):
     return enriched
 
 
-# Apply to both datasets
-print("\nEnriching regression dataset...")
-reg_enriched = compute_enrichment(reg_df)
-
-print("\nEnriching classification dataset...")
-clf_enriched = compute_enrichment(clf_df)
+# Both tasks share the feature matrix, so it is enriched once
+print("\nEnriching shared feature matrix...")
+enriched = compute_enrichment(features_df)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 4. VALIDATE & SAVE
@@ -345,8 +421,7 @@ enrichment_cols = [
 
 # Validate no NaN in enrichment columns
 for col in enrichment_cols:
-    assert reg_enriched[col].isna().sum() == 0, f"NaN in regression {col}"
-    assert clf_enriched[col].isna().sum() == 0, f"NaN in classification {col}"
+    assert enriched[col].isna().sum() == 0, f"NaN in {col}"
 print("Validation: No NaN values in enrichment features ✓")
 
 # Correlation with targets
@@ -354,17 +429,15 @@ print("\nEnrichment feature correlations:")
 print(f"  {'Feature':<30} {'w/ MedHouseVal':>14} {'w/ is_high_value':>16}")
 print("  " + "-" * 62)
 for col in enrichment_cols:
-    corr_reg = reg_enriched[col].corr(reg_enriched['MedHouseVal'])
-    corr_clf = clf_enriched[col].corr(clf_enriched['is_high_value'])
+    corr_reg = enriched[col].corr(y_reg)
+    corr_clf = enriched[col].corr(y_clf)
     bar = "█" * int(abs(corr_reg) * 30)
     print(f"  {col:<30} {corr_reg:>+.4f}         {corr_clf:>+.4f}  {bar}")
 
 # Save
-reg_enr_path = os.path.join(PROC_DIR, 'regression_dataset_enriched.csv')
-clf_enr_path = os.path.join(PROC_DIR, 'classification_dataset_enriched.csv')
+enr_path = os.path.join(PROC_DIR, 'features_enriched.parquet')
 
-reg_enriched.to_csv(reg_enr_path, index=False)
-clf_enriched.to_csv(clf_enr_path, index=False)
+enriched.to_parquet(enr_path, index=False, compression='snappy')
 
 n_new = len(enrichment_cols)
 print(f"""
@@ -373,17 +446,13 @@ ENRICHMENT COMPLETE — WITH LIVE WEB SCRAPING
 {'='*70}
 
 Features added: {n_new}
-  Regression:     {reg_df.shape[1]-1} → {reg_enriched.shape[1]-1} features (+{n_new})
-  Classification: {clf_df.shape[1]-1} → {clf_enriched.shape[1]-1} features (+{n_new})
+  Regression & classification: {features_df.shape[1]} → {enriched.shape[1]} features (+{n_new})
 
 Output:
-  {reg_enr_path}
-    {reg_enriched.shape[0]:,} rows × {reg_enriched.shape[1]} columns
-
-  {clf_enr_path}
-    {clf_enriched.shape[0]:,} rows × {clf_enriched.shape[1]} columns
+  {enr_path}
+    {enriched.shape[0]:,} rows × {enriched.shape[1]} columns
 
-External data sources (web scraped at runtime):
+External data sources (web scraped; cached responses reused unless --refresh):
   ✓ US Census Bureau Geocoding API ({len(CITIES)} cities)
   ✓ NOAA NCEI Station API ({len(COAST_POINTS)} coastal points)
   ✓ Open-Meteo Climate API ({len(CLIMATE_DATA)} climate zones validated)
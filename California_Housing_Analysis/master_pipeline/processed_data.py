@@ -0,0 +1,37 @@
+"""
+Readers for the processed datasets shared by the pipeline steps.
+
+Steps 1-2 write Parquet (features, features_enriched, target_regression,
+target_classification). Until they have been rerun, the tracked CSV exports
+from the earlier layout (one combined features + target file per task) are
+split into the same shapes instead.
+"""
+
+import os
+import pandas as pd
+
+PROJ_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROC_DIR = os.path.join(PROJ_DIR, 'data', 'processed')
+
+# Parquet name -> (tracked CSV export, target column to keep, or None for the features)
+CSV_EXPORTS = {
+    'features': ('regression_dataset.csv', None),
+    'features_enriched': ('regression_dataset_enriched.csv', None),
+    'target_regression': ('regression_dataset.csv', 'MedHouseVal'),
+    'target_classification': ('classification_dataset.csv', 'is_high_value'),
+}
+
+
+def read_processed(name, columns=None):
+    """Read a processed Parquet dataset, falling back to its tracked CSV export."""
+    path = os.path.join(PROC_DIR, f'{name}.parquet')
+    if os.path.exists(path):
+        return pd.read_parquet(path, columns=columns)
+
+    csv_file, target = CSV_EXPORTS[name]
+    csv_path = os.path.join(PROC_DIR, csv_file)
+    if target is not None:
+        return pd.read_csv(csv_path, usecols=[target])
+    if columns is not None:
+        return pd.read_csv(csv_path, usecols=columns)[columns]
+    return pd.read_csv(csv_path).drop(columns='MedHouseVal')
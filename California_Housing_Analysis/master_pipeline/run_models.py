@@ -8,7 +8,6 @@ Classification models: Logistic Regression, Decision Tree, Naive Bayes, LDA, Per
 """
 
 import numpy as np
-import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, PolynomialFeatures
 from sklearn.linear_model import Ridge, Lasso, LogisticRegression, Perceptron
@@ -19,28 +18,28 @@ from sklearn.metrics import (r2_score, mean_absolute_error,
                              accuracy_score, f1_score, precision_score, recall_score)
 import statsmodels.api as sm
 import warnings
-import os
+
+from processed_data import read_processed
 
 warnings.filterwarnings('ignore')
 np.random.seed(42)
 
-PROJ_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-PROC_DIR = os.path.join(PROJ_DIR, 'data', 'processed')
-
 # ══════════════════════════════════════════════════════════════════════════════
 # LOAD DATA
 # ══════════════════════════════════════════════════════════════════════════════
-reg_df = pd.read_csv(os.path.join(PROC_DIR, 'regression_dataset_enriched.csv'))
-clf_df = pd.read_csv(os.path.join(PROC_DIR, 'classification_dataset_enriched.csv'))
+# Both tasks share the enriched feature matrix; each target is its own file
+features_df = read_processed('features_enriched')
+y_reg = read_processed('target_regression')['MedHouseVal']
+y_clf = read_processed('target_classification')['is_high_value']
 
-reg_features = [c for c in reg_df.columns if c != 'MedHouseVal']
-clf_features = [c for c in clf_df.columns if c != 'is_high_value']
+reg_features = list(features_df.columns)
+clf_features = list(features_df.columns)
 
 print("=" * 80)
 print("WHITE-BOX MODEL ANALYSIS — CALIFORNIA HOUSING (ENRICHED)")
 print("=" * 80)
-print(f"\nRegression:     {reg_df.shape[0]:,} rows × {len(reg_features)} features → target: MedHouseVal")
-print(f"Classification: {clf_df.shape[0]:,} rows × {len(clf_features)} features → target: is_high_value")
+print(f"\nRegression:     {features_df.shape[0]:,} rows × {len(reg_features)} features → target: MedHouseVal")
+print(f"Classification: {features_df.shape[0]:,} rows × {len(clf_features)} features → target: is_high_value")
 
 # ══════════════════════════════════════════════════════════════════════════════
 # PART 1: REGRESSION
@@ -49,8 +48,7 @@ print(f"\n{'='*80}")
 print("PART 1: REGRESSION — 5 MODELS")
 print("=" * 80)
 
-X_reg = reg_df[reg_features]
-y_reg = reg_df['MedHouseVal']
+X_reg = features_df[reg_features]
 
 X_train, X_test, y_train, y_test = train_test_split(
     X_reg, y_reg, test_size=0.2, random_state=42)
@@ -169,8 +167,7 @@ print(f"\n{'='*80}")
 print("PART 2: CLASSIFICATION — 5 MODELS")
 print("=" * 80)
 
-X_clf = clf_df[clf_features]
-y_clf = clf_df['is_high_value']
+X_clf = features_df[clf_features]
 
 X_train_c, X_test_c, y_train_c, y_test_c = train_test_split(
     X_clf, y_clf, test_size=0.2, random_state=42, stratify=y_clf)
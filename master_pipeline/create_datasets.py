@@ -1,13 +1,29 @@
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder
 import warnings
 warnings.filterwarnings('ignore')
 
 RANDOM_STATE = 42
 np.random.seed(RANDOM_STATE)
 
-df = pd.read_csv('rideshare_kaggle.csv')
+# only the raw columns the pipeline reads; the other ~45 are never touched
+RAW_COLUMNS = [
+    'timestamp', 'source', 'destination', 'cab_type', 'name',
+    'price', 'distance', 'surge_multiplier',
+    'temperature', 'precipIntensity', 'humidity', 'windSpeed'
+]
+
+# explicit schema: no dtype inference pass, low-cardinality strings as categories
+RAW_DTYPES = {
+    'timestamp': 'float64',
+    'source': 'category', 'destination': 'category',
+    'cab_type': 'category', 'name': 'category',
+    'price': 'float64', 'distance': 'float64', 'surge_multiplier': 'float64',
+    'temperature': 'float32', 'precipIntensity': 'float32',
+    'humidity': 'float32', 'windSpeed': 'float32',
+}
+
+df = pd.read_csv('rideshare_kaggle.csv', engine='pyarrow', usecols=RAW_COLUMNS, dtype=RAW_DTYPES)
 print(f"Raw dataset: {df.shape[0]} rows, {df.shape[1]} columns")
 print(df[['price', 'name', 'cab_type', 'distance', 'surge_multiplier']].head(3))
 
@@ -20,8 +36,9 @@ print(f"Rows dropped: {693071 - df_clean.shape[0]}")
 print(f"Missing prices remaining: {df_clean['price'].isna().sum()}")
 
 # stratified sampling
-df_clean['price_category'] = pd.cut(df_clean['price'], bins=[0, 10, 15, 25, 1000], 
-                                   labels=['low', 'mid', 'high', 'premium'])
+# right-closed bins (0, 10], (10, 15], (15, 25], (25, inf) as int8 codes
+price_codes = np.searchsorted([10, 15, 25], df_clean['price'].to_numpy(), side='left').astype(np.int8)
+df_clean['price_category'] = pd.Categorical.from_codes(price_codes, categories=['low', 'mid', 'high', 'premium'])
 
 df_clean['strata'] = (
     df_clean['cab_type'].astype(str) + '_' +
@@ -54,44 +71,42 @@ print(df_sample['price_category'].value_counts())
 # feature engineering
 df = df_sample.copy()
 
-df['timestamp'] = pd.to_datetime(df['timestamp'])
-df['hour'] = df['timestamp'].dt.hour
-df['day'] = df['timestamp'].dt.day
-df['day_of_week'] = df['timestamp'].dt.dayofweek
-df['month'] = df['timestamp'].dt.month
+df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s', cache=True)
+ts = df['timestamp'].to_numpy()
+days = ts.astype('datetime64[D]')
+df['hour'] = ((ts - days) // np.timedelta64(1, 'h')).astype(np.int8)
+df['day_of_week'] = ((days.view('i8') + 3) % 7).astype(np.int8)  # 1970-01-01 was a Thursday
 
-df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
-df['is_morning_rush'] = ((df['hour'] >= 7) & (df['hour'] <= 9) & (df['is_weekend'] == 0)).astype(int)
-df['is_evening_rush'] = ((df['hour'] >= 17) & (df['hour'] <= 19) & (df['is_weekend'] == 0)).astype(int)
+df['is_weekend'] = (df['day_of_week'] >= 5).astype(np.int8)
+df['is_morning_rush'] = ((df['hour'] >= 7) & (df['hour'] <= 9) & (df['is_weekend'] == 0)).astype(np.int8)
+df['is_evening_rush'] = ((df['hour'] >= 17) & (df['hour'] <= 19) & (df['is_weekend'] == 0)).astype(np.int8)
 df['is_rush_hour'] = df['is_morning_rush'] | df['is_evening_rush']
-df['is_night'] = ((df['hour'] >= 22) | (df['hour'] <= 5)).astype(int)
+df['is_night'] = ((df['hour'] >= 22) | (df['hour'] <= 5)).astype(np.int8)
 
 df['hour_sin'] = np.sin(df['hour'] * (2. * np.pi / 24))
 df['hour_cos'] = np.cos(df['hour'] * (2. * np.pi / 24))
 df['dow_sin'] = np.sin(df['day_of_week'] * (2. * np.pi / 7))
 df['dow_cos'] = np.cos(df['day_of_week'] * (2. * np.pi / 7))
 
-df['short_ride'] = (df['distance'] < 2).astype(int)
-df['medium_ride'] = ((df['distance'] >= 2) & (df['distance'] < 5)).astype(int)
-df['long_ride'] = (df['distance'] >= 5).astype(int)
+df['short_ride'] = (df['distance'] < 2).astype(np.int8)
+df['medium_ride'] = ((df['distance'] >= 2) & (df['distance'] < 5)).astype(np.int8)
+df['long_ride'] = (df['distance'] >= 5).astype(np.int8)
 df['log_distance'] = np.log1p(df['distance'])
 
 if 'precipIntensity' in df.columns:
-    df['is_rainy'] = (df['precipIntensity'] > 0).astype(int)
+    df['is_rainy'] = (df['precipIntensity'] > 0).astype(np.int8)
 elif 'rain' in df.columns:
-    df['is_rainy'] = (df['rain'] > 0).astype(int)
+    df['is_rainy'] = (df['rain'] > 0).astype(np.int8)
 else:
     df['is_rainy'] = 0
 
 if 'temperature' in df.columns:
-    df['is_cold'] = (df['temperature'] < 40).astype(int)
-    df['is_hot'] = (df['temperature'] > 75).astype(int)
+    df['is_cold'] = (df['temperature'] < 40).astype(np.int8)
 else:
     df['is_cold'] = 0
-    df['is_hot'] = 0
 
 if 'humidity' in df.columns:
-    df['is_high_humidity'] = (df['humidity'] > 70).astype(int)
+    df['is_high_humidity'] = (df['humidity'] > 70).astype(np.int8)
 else:
     df['is_high_humidity'] = 0
 
@@ -101,16 +116,16 @@ df['distance_surge'] = df['distance'] * df['surge_multiplier']
 df['weather_surge'] = df['is_rainy'] * df['surge_multiplier']
 df['rush_surge'] = df['is_rush_hour'] * df['surge_multiplier']
 
-df['is_premium'] = df['name'].str.contains('Black|Lux|SUV|XL', case=False, na=False).astype(int)
-df['uber_premium'] = ((df['cab_type'] == 'Uber') & (df['is_premium'] == 1)).astype(int)
-df['lyft_premium'] = ((df['cab_type'] == 'Lyft') & (df['is_premium'] == 1)).astype(int)
+df['is_premium'] = df['name'].str.contains('Black|Lux|SUV|XL', case=False, na=False).astype(np.int8)
 
 # encoding
 cat_cols = ['cab_type', 'name', 'source', 'destination']
 for col in cat_cols:
     if col in df.columns:
-        le = LabelEncoder()
-        df[col + '_encoded'] = le.fit_transform(df[col].astype(str))
+        # already categorical: keep only categories present in the sample, sorted
+        # so the codes match LabelEncoder's ordering
+        cats = df[col].cat.remove_unused_categories()
+        df[col + '_encoded'] = cats.cat.reorder_categories(sorted(cats.cat.categories)).cat.codes
         print("Encoded value mapping (sample):")
 print(df[['cab_type', 'cab_type_encoded']].drop_duplicates().sort_values('cab_type'))
 print()
@@ -119,7 +134,7 @@ print(df[['name', 'name_encoded']].drop_duplicates().sort_values('name_encoded')
 
 if 'source' in df.columns and 'destination' in df.columns:
     df['route'] = df['source'].astype(str) + '_' + df['destination'].astype(str)
-    df['route_encoded'] = LabelEncoder().fit_transform(df['route'])
+    df['route_encoded'] = pd.Categorical(df['route']).codes
 
 # finalise feature lists 
 regression_features = [
@@ -142,7 +157,6 @@ classification_features = [
 ]
 
 y_price = df['price']
-y_premium = df['name'].str.contains('Black|Lux|SUV|XL', case=False, na=False).astype(int)
 
 
 print(f"Regression features ({len(regression_features)}): {regression_features}")
@@ -152,19 +166,18 @@ removed = set(regression_features) - set(classification_features)
 print(removed)
 
 # save datasets
-regression_df = df[regression_features + ['price']].copy()
+regression_df = df[regression_features + ['price']]
 regression_df.columns = [col.replace('_encoded', '') for col in regression_df.columns]
 
-classification_df = df[classification_features].copy()
-classification_df['is_premium'] = y_premium.values
+classification_df = df[classification_features + ['is_premium']]
 classification_df.columns = [col.replace('_encoded', '') for col in classification_df.columns]
 
 output_dir = '../new_data/processed'
 
-reg_file = f'{output_dir}/regression_dataset.csv'
-clf_file = f'{output_dir}/classification_dataset.csv'
+reg_file = f'{output_dir}/regression_dataset.parquet'
+clf_file = f'{output_dir}/classification_dataset.parquet'
 
-regression_df.to_csv(reg_file, index=False)
+regression_df.to_parquet(reg_file, index=False, compression='zstd')
 print("Regression dataset created")
-classification_df.to_csv(clf_file, index=False)
+classification_df.to_parquet(clf_file, index=False, compression='zstd')
 print("Classification dataset created")
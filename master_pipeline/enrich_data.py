@@ -8,20 +8,18 @@ import requests
 from datetime import datetime, timedelta
 import time
 import warnings
+
+from processed_data import read_dataset
+
 warnings.filterwarnings('ignore')
 
 API_TIMEOUT = 30
 
 print("DATA ENRICHMENT - WEB SCRAPING")
 
-# Load datasets
-print("\n1. Loading datasets...")
+# Datasets are enriched and written one at a time (see bottom of script)
 DATA_DIR = '../new_data/processed'
-reg_df = pd.read_csv(f'{DATA_DIR}/regression_dataset.csv')
-clf_df = pd.read_csv(f'{DATA_DIR}/classification_dataset.csv')
-
-print(f"Regression dataset: {len(reg_df)} records")
-print(f"Classification dataset: {len(clf_df)} records")
+DATASETS = ['regression_dataset', 'classification_dataset']
 
 # Enrichment 1: Weather from Open-Meteo API
 print("\nENRICHMENT 1: BOSTON WEATHER (Open-Meteo API)")
@@ -33,7 +31,8 @@ def get_boston_weather_history():
     end_date = datetime.now()
     start_date = end_date - timedelta(days=30)
     
-    url = f"https://archive-api.open-meteo.com/v1/archive?latitude={lat}&longitude={lon}&start_date={start_date.strftime('%Y-%m-%d')}&end_date={end_date.strftime('%Y-%m-%d')}&hourly=temperature_2m,relative_humidity_2m,precipitation,rain,weather_code,cloud_cover,wind_speed_10m,pressure_msl&timezone=America/New_York"
+    # Only the variables behind the derived flags below are requested
+    url = f"https://archive-api.open-meteo.com/v1/archive?latitude={lat}&longitude={lon}&start_date={start_date.strftime('%Y-%m-%d')}&end_date={end_date.strftime('%Y-%m-%d')}&hourly=temperature_2m,precipitation,wind_speed_10m&timezone=America/New_York"
     
     try:
         response = requests.get(url, timeout=API_TIMEOUT)
@@ -43,13 +42,8 @@ def get_boston_weather_history():
         weather_df = pd.DataFrame({
             'datetime': pd.to_datetime(hourly.get('time', [])),
             'temp_enhanced': hourly.get('temperature_2m', []),
-            'humidity_enhanced': hourly.get('relative_humidity_2m', []),
             'precipitation': hourly.get('precipitation', []),
-            'rain_intensity': hourly.get('rain', []),
-            'weather_code': hourly.get('weather_code', []),
-            'cloud_cover': hourly.get('cloud_cover', []),
-            'wind_speed': hourly.get('wind_speed_10m', []),
-            'pressure': hourly.get('pressure_msl', [])
+            'wind_speed': hourly.get('wind_speed_10m', [])
         })
         
         # Add derived features
@@ -77,7 +71,7 @@ def get_boston_weather_history():
 weather_data = get_boston_weather_history()
 if weather_data is not None:
     print(f"Fetched {len(weather_data)} hourly weather records")
-    print(f"Weather features: temp, humidity, precipitation, wind, pressure, severity score")
+    print(f"Weather features: temp, precipitation, wind, severity score")
 
 # Enrichment 2: Boston Events
 print("\nENRICHMENT 2: BOSTON EVENTS & VENUES")
@@ -190,9 +184,9 @@ gas_data = get_boston_gas_prices()
 print("\nMERGING ENRICHED DATA")
 
 def enrich_dataset(df, weather_df=None):
-    """Add enrichment features to dataset"""
+    """Add enrichment features to dataset (in place, returns df)"""
     
-    df_enriched = df.copy()
+    df_enriched = df
     
     # Enhanced weather features
     if weather_df is not None:
@@ -238,33 +232,24 @@ def enrich_dataset(df, weather_df=None):
     
     return df_enriched
 
-# Enrich both datasets
-print("\nEnriching regression dataset...")
-reg_df_enriched = enrich_dataset(reg_df, weather_data)
-
-print("Enriching classification dataset...")
-clf_df_enriched = enrich_dataset(clf_df, weather_data)
-
-# Show new features
-new_features = [col for col in reg_df_enriched.columns if col not in reg_df.columns]
-print(f"\nAdded {len(new_features)} enrichment features:")
-for feat in new_features:
-    print(f"  - {feat}")
-
-# Save enriched datasets
-print("\nSAVING ENRICHED DATASETS")
-
-reg_enriched_file = f'{DATA_DIR}/regression_dataset_enriched.csv'
-clf_enriched_file = f'{DATA_DIR}/classification_dataset_enriched.csv'
-
-reg_df_enriched.to_csv(reg_enriched_file, index=False)
-clf_df_enriched.to_csv(clf_enriched_file, index=False)
-
-print(f"Saved enriched regression: {reg_enriched_file}")
-print(f"  Shape: {reg_df_enriched.shape}")
-
-print(f"Saved enriched classification: {clf_enriched_file}")
-print(f"  Shape: {clf_df_enriched.shape}")
+# Enrich and save each dataset in turn so only one frame is in memory at a time
+enriched_files = []
+for name in DATASETS:
+    df = read_dataset(f'{DATA_DIR}/{name}.parquet')
+    print(f"\nEnriching {name}: {len(df)} records")
+    base_cols = list(df.columns)
+    df = enrich_dataset(df, weather_data)
+
+    new_features = [col for col in df.columns if col not in base_cols]
+    print(f"Added {len(new_features)} enrichment features:")
+    for feat in new_features:
+        print(f"  - {feat}")
+
+    enriched_file = f'{DATA_DIR}/{name}_enriched.parquet'
+    df.to_parquet(enriched_file, index=False, compression='zstd')
+    enriched_files.append(enriched_file)
+    print(f"Saved enriched dataset: {enriched_file}")
+    print(f"  Shape: {df.shape}")
 
 # Summary
 print("\nDATA ENRICHMENT SUMMARY")
@@ -287,8 +272,8 @@ print("  7. weather_rush_interaction - Rain x rush hour")
 print("  8. cab_weather_interaction - Cab type x rain")
 
 print("\nOUTPUT FILES:")
-print(f"  {reg_enriched_file}")
-print(f"  {clf_enriched_file}")
+for enriched_file in enriched_files:
+    print(f"  {enriched_file}")
 
 print("\nEnrichment complete!")
 print("Next step: Run models on enriched datasets")
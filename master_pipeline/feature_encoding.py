@@ -0,0 +1,31 @@
+"""
+Categorical feature encoding shared by the rideshare and flight training pipelines
+"""
+
+from sklearn.preprocessing import LabelEncoder
+
+
+def encode_features(X, encoders=None, fit=True):
+    """Encode categorical features"""
+    X = X.copy()
+    cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
+    
+    if encoders is None:
+        encoders = {}
+    
+    for col in cat_cols:
+        X[col] = X[col].astype(str)
+        if fit:
+            le = LabelEncoder()
+            X[col] = le.fit_transform(X[col])
+            encoders[col] = le
+        else:
+            le = encoders.get(col)
+            if le is not None:
+                # Build the class -> code table once instead of a transform() call per row
+                codes = {cls: i for i, cls in enumerate(le.classes_)}
+                X[col] = X[col].map(codes).fillna(-1).astype(int)
+            else:
+                X[col] = -1
+    
+    return X, encoders
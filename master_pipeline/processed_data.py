@@ -0,0 +1,15 @@
+"""
+Reader for the processed rideshare datasets shared by the pipeline scripts
+"""
+
+import os
+import pandas as pd
+
+
+def read_dataset(path, columns=None):
+    """Read a processed parquet dataset, or the tracked CSV export if it has not been generated"""
+    if os.path.exists(path):
+        return pd.read_parquet(path, columns=columns)
+    # Older pipeline snapshots (e.g. UberLyft_Boston_Analysis) only have the CSV export
+    df = pd.read_csv(path.replace('.parquet', '.csv'), usecols=columns)
+    return df if columns is None else df[columns]
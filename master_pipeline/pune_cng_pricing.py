@@ -40,28 +40,28 @@ data = {
 df = pd.DataFrame(data)
 
 # 3. PUNE PRICING FORMULA (The "Ground Truth" for ML to learn)
-def calculate_fare(row):
-    # RTO Based logic + Surges
-    base_rates = {'Rickshaw': 15, 'UberGo': 18, 'Premier': 25}
-    fare = row['distance_km'] * base_rates[row['vehicle_type']]
+BASE_RATES = {'Rickshaw': 15, 'UberGo': 18, 'Premier': 25}  # RTO per-km rates
+PEAK_HOURS = frozenset({8, 9, 17, 18})
+
+def calculate_fares(df):
+    # RTO Based logic + Surges, computed column-wise for every ride at once
+    fare = df['distance_km'] * df['vehicle_type'].map(BASE_RATES)
     
     # Apply Scraped CNG factor
     fare += (cng_price * 0.05) 
     
     # Peak Hour Surge (9 AM & 6 PM)
-    if row['hour'] in [8, 9, 17, 18]:
-        fare *= 1.4
+    fare *= np.where(df['hour'].isin(PEAK_HOURS), 1.4, 1.0)
     
     # Monsoon Surge
-    if row['is_monsoon'] == 1:
-        fare *= 1.3
+    fare *= np.where(df['is_monsoon'] == 1, 1.3, 1.0)
         
     # Traffic Multiplier
-    fare *= row['traffic_level']
+    fare *= df['traffic_level']
     
-    return fare + np.random.normal(0, 2) # Add some noise
+    return fare + np.random.normal(0, 2, len(df)) # Add some noise
 
-df['final_fare_inr'] = df.apply(calculate_fare, axis=1)
+df['final_fare_inr'] = calculate_fares(df)
 
 # 4. TRAIN PUNE ML MODEL
 df_encoded = pd.get_dummies(df, columns=['vehicle_type'])
@@ -2,11 +2,10 @@
 Run 5 regression and 5 classification models on enriched datasets
 """
 
-import pandas as pd
 import numpy as np
 import warnings
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, PolynomialFeatures
+from sklearn.preprocessing import PolynomialFeatures
 from sklearn.linear_model import Ridge, Lasso, LogisticRegression, Perceptron
 from sklearn.tree import DecisionTreeRegressor, DecisionTreeClassifier
 from sklearn.naive_bayes import GaussianNB
@@ -16,12 +15,14 @@ from sklearn.metrics import (mean_absolute_error, mean_squared_error, r2_score,
                              f1_score, confusion_matrix)
 import statsmodels.api as sm
 
+from processed_data import read_dataset
+
 warnings.filterwarnings('ignore')
 np.random.seed(42)
 
 DATA_DIR = '../new_data/processed'
-REG_PATH = f'{DATA_DIR}/regression_dataset_enriched.csv'
-CLF_PATH = f'{DATA_DIR}/classification_dataset_enriched.csv'
+REG_PATH = f'{DATA_DIR}/regression_dataset_enriched.parquet'
+CLF_PATH = f'{DATA_DIR}/classification_dataset_enriched.parquet'
 
 
 def print_confusion(cm, labels=('standard', 'premium')):
@@ -33,10 +34,27 @@ def print_confusion(cm, labels=('standard', 'premium')):
     print(f"  Specificity: {spec:.4f}   TP={tp}  TN={tn}  FP={fp}  FN={fn}")
 
 
+def standardize(train, test):
+    """Z-score train/test with the train mean and std (same maths as StandardScaler)"""
+    train = np.array(train, dtype=np.float32)
+    test = np.array(test, dtype=np.float32)
+    # Statistics in float64; a constant float32 column leaves ~1e-8 rounding noise in
+    # its std, so near-zero spreads (relative to the mean) are treated as constant
+    mu = train.mean(axis=0, dtype=np.float64)
+    sd = train.std(axis=0, dtype=np.float64)
+    sd[sd < 10 * np.finfo(np.float32).eps * np.maximum(np.abs(mu), 1)] = 1.0
+    mu, sd = mu.astype(np.float32), sd.astype(np.float32)
+    train -= mu
+    train /= sd
+    test -= mu
+    test /= sd
+    return train, test
+
+
 print("Running models on enriched datasets")
 
-reg_df = pd.read_csv(REG_PATH)
-clf_df = pd.read_csv(CLF_PATH)
+reg_df = read_dataset(REG_PATH)
+clf_df = read_dataset(CLF_PATH)
 
 print(f"\nRegression:     {reg_df.shape[0]:,} rows x {reg_df.shape[1]-1} features   target: price")
 print(f"Classification: {clf_df.shape[0]:,} rows x {clf_df.shape[1]-1} features   target: is_premium")
@@ -44,16 +62,14 @@ print(f"Classification: {clf_df.shape[0]:,} rows x {clf_df.shape[1]-1} features
 # Regression
 print("\nREGRESSION - 5 MODELS")
 
-X_reg = reg_df.drop('price', axis=1)
+X_reg = reg_df.drop('price', axis=1).astype(np.float32)
 y_reg = reg_df['price']
 feature_names_reg = X_reg.columns.tolist()
 
 X_train_r, X_test_r, y_train_r, y_test_r = train_test_split(
     X_reg, y_reg, test_size=0.2, random_state=42)
 
-scaler_r = StandardScaler()
-X_train_rs = scaler_r.fit_transform(X_train_r)
-X_test_rs = scaler_r.transform(X_test_r)
+X_train_rs, X_test_rs = standardize(X_train_r, X_test_r)
 
 print(f"\nTrain: {len(X_train_r):,}   Test: {len(X_test_r):,}   Features: {len(feature_names_reg)}")
 print(f"Price range: ${y_reg.min():.2f} - ${y_reg.max():.2f}\n")
@@ -150,16 +166,14 @@ print(f"\nBest: {best_reg[0]}   R2={best_reg[1]['R2']:.4f}  MAE=${best_reg[1]['M
 # Classification
 print("\nCLASSIFICATION - 5 MODELS")
 
-X_clf = clf_df.drop('is_premium', axis=1)
+X_clf = clf_df.drop('is_premium', axis=1).astype(np.float32)
 y_clf = clf_df['is_premium']
 feature_names_clf = X_clf.columns.tolist()
 
 X_train_c, X_test_c, y_train_c, y_test_c = train_test_split(
     X_clf, y_clf, test_size=0.2, random_state=42, stratify=y_clf)
 
-scaler_c = StandardScaler()
-X_train_cs = scaler_c.fit_transform(X_train_c)
-X_test_cs = scaler_c.transform(X_test_c)
+X_train_cs, X_test_cs = standardize(X_train_c, X_test_c)
 
 print(f"\nTrain: {len(X_train_c):,}   Test: {len(X_test_c):,}   Features: {len(feature_names_clf)}")
 print(f"Premium rate: {y_clf.mean()*100:.1f}%\n")
@@ -9,8 +9,8 @@ from sklearn.metrics import (accuracy_score, precision_score, recall_score, f1_s
                              mean_absolute_error, mean_squared_error, r2_score)
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.pipeline import Pipeline
+
+from feature_encoding import encode_features
 
 warnings.filterwarnings("ignore")
 
@@ -59,30 +59,6 @@ def add_flight_features(df):
     return df
 
 
-def encode_features(X, encoders=None, fit=True):
-    """Encode categorical features"""
-    X = X.copy()
-    cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
-    
-    if encoders is None:
-        encoders = {}
-    
-    for col in cat_cols:
-        X[col] = X[col].astype(str)
-        if fit:
-            le = LabelEncoder()
-            X[col] = le.fit_transform(X[col])
-            encoders[col] = le
-        else:
-            le = encoders.get(col)
-            if le is not None:
-                X[col] = X[col].map(lambda v: le.transform([v])[0] if v in set(le.classes_) else -1)
-            else:
-                X[col] = -1
-    
-    return X, encoders
-
-
 def main():
     print("="*70)
     print("FLIGHT DELAY PREDICTION - ML PIPELINE")
@@ -9,10 +9,11 @@ from sklearn.metrics import (accuracy_score, precision_score, recall_score, f1_s
                              mean_absolute_error, mean_squared_error, r2_score)
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.linear_model import LinearRegression, Ridge
 from xgboost import XGBRegressor, XGBClassifier
 
+from feature_encoding import encode_features
+
 # Paths
 RIDESHARE_CSV = "/tmp/rideshare_sample_stratified.csv"
 MODELS_DIR = "/home/kushagarwal/CascadeProjects/Supply_Chain_Optimization/master_pipeline/models"
@@ -75,10 +76,12 @@ def add_rideshare_features(df):
     
     # Cab type * product interactions
     if 'cab_type' in df.columns and 'name' in df.columns:
-        df['uber_premium'] = ((df['cab_type'] == 'Uber') & 
-                              (df['name'].isin(['Black', 'Black SUV']))).astype(int)
-        df['lyft_premium'] = ((df['cab_type'] == 'Lyft') & 
-                              (df['name'].isin(['Lux', 'Lux Black', 'Lux Black XL']))).astype(int)
+        cab = df['cab_type'].to_numpy()
+        name = df['name'].to_numpy()
+        df['uber_premium'] = ((cab == 'Uber') &
+                              ((name == 'Black') | (name == 'Black SUV'))).astype(np.int8)
+        df['lyft_premium'] = ((cab == 'Lyft') &
+                              ((name == 'Lux') | (name == 'Lux Black') | (name == 'Lux Black XL'))).astype(np.int8)
         df['is_premium'] = df['uber_premium'] | df['lyft_premium']
     
     # Route popularity (source-destination pair)
@@ -87,30 +90,6 @@ def add_rideshare_features(df):
     return df
 
 
-def encode_features(X, encoders=None, fit=True):
-    """Encode categorical features"""
-    X = X.copy()
-    cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
-    
-    if encoders is None:
-        encoders = {}
-    
-    for col in cat_cols:
-        X[col] = X[col].astype(str)
-        if fit:
-            le = LabelEncoder()
-            X[col] = le.fit_transform(X[col])
-            encoders[col] = le
-        else:
-            le = encoders.get(col)
-            if le is not None:
-                X[col] = X[col].map(lambda v: le.transform([v])[0] if v in set(le.classes_) else -1)
-            else:
-                X[col] = -1
-    
-    return X, encoders
-
-
 def main():
     print("="*70)
     print("UBER/LYFT BOSTON - RIDE PRICE PREDICTION")
@@ -1,18 +1,30 @@
 """
 Generate 6 visualization plots
+
+Usage:
+    python visualization.py [processed_dir] [plots_dir]
+
+processed_dir defaults to ../new_data/processed and plots_dir to ../new_data/plots.
+The enriched regression parquet is read if present, otherwise its CSV export.
 """
 
 import os
+import sys
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 from scipy import stats
 
-# File paths
-REG_PATH = "../new_data/processed/regression_dataset_enriched.csv"
-CLF_PATH = "../new_data/processed/classification_dataset_enriched.csv"
-PLOTS_DIR = "../new_data/plots"
+from processed_data import read_dataset
+
+# File paths, overridable as: python visualization.py [processed_dir] [plots_dir]
+DATA_DIR = sys.argv[1] if len(sys.argv) > 1 else "../new_data/processed"
+PLOTS_DIR = sys.argv[2] if len(sys.argv) > 2 else "../new_data/plots"
+REG_PATH = os.path.join(DATA_DIR, "regression_dataset_enriched.parquet")
+
+# Only the columns the plots below touch are read from disk
+REG_COLUMNS = ["price", "cab_type", "name", "distance", "is_premium",
+               "short_ride", "medium_ride", "surge_multiplier", "weather_severity"]
 
 os.makedirs(PLOTS_DIR, exist_ok=True)
 
@@ -24,11 +36,9 @@ def save(filename):
 
 # Load data
 print("Loading data...")
-reg = pd.read_csv(REG_PATH)
-clf = pd.read_csv(CLF_PATH)
+reg = read_dataset(REG_PATH, columns=REG_COLUMNS)
 
 reg["Cab"] = reg["cab_type"].map({0: "Lyft", 1: "Uber"})
-clf["Cab"] = clf["cab_type"].map({0: "Lyft", 1: "Uber"})
 
 uber = reg[reg["Cab"] == "Uber"]["price"]
 lyft = reg[reg["Cab"] == "Lyft"]["price"]
@@ -112,18 +122,18 @@ save("03_qq_fare_normality.png")
 # 4. Box plot - Fare by ride length and cab type
 fig, ax = plt.subplots(figsize=(10, 6))
 
-def ride_label(row):
-    if row["short_ride"]: return "Short (<1.5 mi)"
-    if row["medium_ride"]: return "Medium (1.5-3 mi)"
-    return "Long (>3 mi)"
-
-reg["ride_type"] = reg.apply(ride_label, axis=1)
 ride_order = ["Short (<1.5 mi)", "Medium (1.5-3 mi)", "Long (>3 mi)"]
+reg["ride_type"] = np.select(
+    [reg["short_ride"].to_numpy() == 1, reg["medium_ride"].to_numpy() == 1],
+    ride_order[:2], default=ride_order[2])
+
+# One pass groups every (ride length, cab) price series instead of filtering per box
+price_groups = {key: grp.to_numpy() for key, grp in reg.groupby(["ride_type", "Cab"])["price"]}
 
 box_data, positions, colors, tick_pos = [], [], [], []
 for i, rt in enumerate(ride_order):
     for j, (cab, col) in enumerate([("Uber", "steelblue"), ("Lyft", "crimson")]):
-        box_data.append(reg[(reg["ride_type"] == rt) & (reg["Cab"] == cab)]["price"].values)
+        box_data.append(price_groups.get((rt, cab), np.array([])))
         positions.append(i * 3 + j)
         colors.append(col)
     tick_pos.append(i * 3 + 0.5)